@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
+from .openai_client import OpenAIRealtimePool
 from .signalwire_bridge import SignalWireRealtimeBridge
 
+logging.basicConfig(level=settings.log_level)
 LOGGER = logging.getLogger(__name__)
 
 app = FastAPI(title="AI Voice Agent", version="0.1.0")
@@ -21,10 +24,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+openai_pool = OpenAIRealtimePool(settings.openai)
+
 
 @app.on_event("startup")
-async def configure_logging() -> None:
-    logging.basicConfig(level=settings.log_level)
+async def start_openai_pool() -> None:
+    await openai_pool.start()
+
+
+@app.on_event("shutdown")
+async def close_openai_pool() -> None:
+    await openai_pool.close()
 
 
 @app.get("/health")
@@ -36,7 +46,13 @@ async def health_check() -> dict:
 async def signalwire_voice_webhook() -> Response:
     """Respond to SignalWire call webhook with instructions to stream audio."""
     stream_url = settings.signalwire.stream_url or "wss://YOUR_SERVER_DOMAIN/signalwire/stream"
-    xml_response = (
+    return Response(content=_stream_response_xml(stream_url), media_type="application/xml")
+
+
+@lru_cache(maxsize=4)
+def _stream_response_xml(stream_url: str) -> bytes:
+    """Render the LaML stream instructions once per stream URL."""
+    return (
         """
     <Response>
         <Connect>
@@ -46,14 +62,14 @@ async def signalwire_voice_webhook() -> Response:
     """
         .strip()
         .format(stream_url=stream_url)
+        .encode()
     )
-    return Response(content=xml_response, media_type="application/xml")
 
 
 @app.websocket("/signalwire/stream")
 async def signalwire_stream(websocket: WebSocket) -> None:
     LOGGER.info("SignalWire websocket connected from %s", websocket.client)
-    bridge = SignalWireRealtimeBridge(websocket)
+    bridge = SignalWireRealtimeBridge(websocket, openai_pool)
     await bridge.run()
 
 
@@ -7,20 +7,26 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# Set VOICE_AGENT_SKIP_DOTENV when the environment is already populated (tests,
+# containers) to skip searching the filesystem for a .env file.
+if not os.getenv("VOICE_AGENT_SKIP_DOTENV"):
+    load_dotenv()
+
 DEFAULT_REALTIME_MODEL = "gpt-4o-realtime-mini"
 DEFAULT_OPENAI_VOICE = "verse"
+DEFAULT_OPENAI_POOL_SIZE = 2
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpenAIConfig:
     api_key: str
     model: str = DEFAULT_REALTIME_MODEL
     voice: str = DEFAULT_OPENAI_VOICE
     instructions: Optional[str] = None
+    pool_size: int = DEFAULT_OPENAI_POOL_SIZE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignalWireConfig:
     space_url: str
     project_id: str
@@ -28,7 +34,7 @@ class SignalWireConfig:
     stream_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings:
     openai: OpenAIConfig
     signalwire: SignalWireConfig
@@ -47,6 +53,7 @@ class Settings:
             model=os.getenv("OPENAI_REALTIME_MODEL", DEFAULT_REALTIME_MODEL),
             voice=os.getenv("OPENAI_VOICE", DEFAULT_OPENAI_VOICE),
             instructions=instructions,
+            pool_size=int(os.getenv("OPENAI_POOL_SIZE", DEFAULT_OPENAI_POOL_SIZE)),
         )
 
         space_url = os.getenv("SIGNALWIRE_SPACE_URL")
@@ -1,14 +1,47 @@
 """Async client for interacting with the OpenAI Realtime API."""
 from __future__ import annotations
 
-import json
-from typing import AsyncGenerator, Dict, Optional
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 
+import msgspec
 import websockets
 
 from .config import OpenAIConfig
 
+LOGGER = logging.getLogger(__name__)
+
 OPENAI_REALTIME_URL = "wss://api.openai.com/v1/realtime"
+SEND_QUEUE_SIZE = 256
+# High-water mark for the socket write buffer; bursts of audio appends should
+# not force a drain on every send.
+WRITE_BUFFER_LIMIT = 2**20
+MAX_MESSAGE_SIZE = 2**20
+PING_INTERVAL = 20
+PING_TIMEOUT = 20
+# Realtime sessions have a server-side maximum duration counted from connect,
+# so warm spares older than this are replaced rather than handed to a call.
+POOL_MAX_IDLE_SECONDS = 300
+POOL_REFRESH_INTERVAL = 60
+
+# Pre-encoded frames for the per-chunk hot path; base64 never needs JSON escaping.
+_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = '"}'
+_COMMIT_FRAME = '{"type":"input_audio_buffer.commit"}'
+_RESPONSE_CREATE_FRAME = '{"type":"response.create","response":{}}'
+
+
+class RealtimeEvent(msgspec.Struct):
+    """Fields of an OpenAI realtime server event that the bridge inspects."""
+
+    type: str
+    delta: Any = None
+    error: Optional[Dict[str, Any]] = None
+
+
+_EVENT_DECODER = msgspec.json.Decoder(RealtimeEvent)
+_JSON_DECODER = msgspec.json.Decoder()
 
 
 class OpenAIRealtimeClient:
@@ -17,6 +50,8 @@ class OpenAIRealtimeClient:
     def __init__(self, config: OpenAIConfig):
         self._config = config
         self._connection: Optional[websockets.WebSocketClientProtocol] = None
+        self._send_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._writer: Optional[asyncio.Task] = None
 
     async def __aenter__(self) -> "OpenAIRealtimeClient":
         await self.connect()
@@ -33,54 +68,135 @@ class OpenAIRealtimeClient:
         if self.is_connected:
             return self._connection  # type: ignore[return-value]
 
-        url = f"{OPENAI_REALTIME_URL}?model={self._config.model}"
+        config = self._config
+        url = f"{OPENAI_REALTIME_URL}?model={config.model}"
         headers = {
-            "Authorization": f"Bearer {self._config.api_key}",
+            "Authorization": f"Bearer {config.api_key}",
             "OpenAI-Beta": "realtime=v1",
         }
-        self._connection = await websockets.connect(url, extra_headers=headers)
+        self._connection = await websockets.connect(
+            url,
+            extra_headers=headers,
+            max_queue=None,
+            write_limit=WRITE_BUFFER_LIMIT,
+            # base64 audio barely compresses, so permessage-deflate only costs CPU
+            compression=None,
+            max_size=MAX_MESSAGE_SIZE,
+            ping_interval=PING_INTERVAL,
+            ping_timeout=PING_TIMEOUT,
+        )
+        self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._writer = asyncio.create_task(self._write_frames(self._connection))
 
         # configure the realtime session
         session_update = {
             "type": "session.update",
             "session": {
-                "voice": self._config.voice,
+                "voice": config.voice,
             },
         }
-        if self._config.instructions:
-            session_update["session"]["instructions"] = self._config.instructions
+        if config.instructions:
+            session_update["session"]["instructions"] = config.instructions
         await self.send_json(session_update)
 
         return self._connection
 
     async def close(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            # let queued frames (e.g. a final commit) reach OpenAI before closing
+            if not writer.done():
+                # race the sentinel against the writer: if the socket dies while
+                # the queue is full, nothing would ever make room for it
+                sentinel = asyncio.ensure_future(self._send_queue.put(None))
+                await asyncio.wait({sentinel, writer}, return_when=asyncio.FIRST_COMPLETED)
+                sentinel.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
         if self._connection and not self._connection.closed:
             await self._connection.close()
         self._connection = None
 
     async def send_json(self, payload: Dict) -> None:
-        if not self.is_connected:
+        await self._send_frame(msgspec.json.encode(payload).decode())
+
+    async def _send_frame(self, frame: str) -> None:
+        if not self.is_connected or self._writer is None:
             raise RuntimeError("Realtime client not connected")
-        await self._connection.send(json.dumps(payload))
+        writer = self._writer
+        if writer.done():
+            cause = None if writer.cancelled() else writer.exception()
+            raise RuntimeError("Realtime client writer stopped") from cause
+        await self._send_queue.put(frame)
+
+    async def _write_frames(self, connection: websockets.WebSocketClientProtocol) -> None:
+        """Send queued frames in order so producers never wait on the socket."""
+        queue = self._send_queue
+        while True:
+            frame = await queue.get()
+            if frame is None:
+                break
+            await connection.send(frame)
+        # producers blocked on a full queue may land behind the close sentinel;
+        # flush them so the sentinel really is the last frame
+        while not queue.empty():
+            frame = queue.get_nowait()
+            if frame is not None:
+                await connection.send(frame)
 
     async def send_audio_chunk(self, audio_base64: str, end_of_input: bool = False) -> None:
-        await self.send_json(
-            {
-                "type": "input_audio_buffer.append",
-                "audio": audio_base64,
-            }
-        )
+        await self._send_frame(_APPEND_PREFIX + audio_base64 + _APPEND_SUFFIX)
         if end_of_input:
-            await self.send_json({"type": "input_audio_buffer.commit"})
-            await self.send_json({"type": "response.create", "response": {}})
+            await self.commit_input()
+
+    def queue_audio_chunk(self, audio_base64: str) -> bool:
+        """Queue an append frame without suspending the caller.
+
+        Returns ``False`` when the frame could not be queued (full queue or
+        unusable connection); callers should then await ``send_audio_chunk``,
+        which applies backpressure or raises.
+        """
+        writer = self._writer
+        if writer is None or writer.done() or not self.is_connected:
+            return False
+        try:
+            self._send_queue.put_nowait(_APPEND_PREFIX + audio_base64 + _APPEND_SUFFIX)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def commit_input(self) -> None:
+        """Commit the buffered input audio and ask the model to respond."""
+        await self._send_frame(_COMMIT_FRAME)
+        await self._send_frame(_RESPONSE_CREATE_FRAME)
 
     async def responses(self) -> AsyncGenerator[Dict, None]:
+        async for batch in self._message_batches():
+            for message in batch:
+                yield _JSON_DECODER.decode(message)
+
+    async def response_batches(self) -> AsyncGenerator[List[RealtimeEvent], None]:
+        """Yield every event already received each time the socket wakes up."""
+        decode = _EVENT_DECODER.decode
+        async for batch in self._message_batches():
+            yield [decode(message) for message in batch]
+
+    async def _message_batches(self) -> AsyncGenerator[List[websockets.Data], None]:
         if not self.is_connected:
             raise RuntimeError("Realtime client not connected")
 
         assert self._connection is not None
-        async for message in self._connection:
-            yield json.loads(message)
+        connection = self._connection
+        while True:
+            try:
+                message = await connection.recv()
+            except websockets.ConnectionClosedOK:
+                return
+            batch = [message]
+            # Safe to pop directly: max_queue=None means no reader waits on space.
+            pending = connection.messages
+            while pending:
+                batch.append(pending.popleft())
+            yield batch
 
     async def drain_until_finished(self) -> Dict:
         """Consume websocket responses until a response is complete."""
@@ -90,3 +206,101 @@ class OpenAIRealtimeClient:
                 final_event = event
                 break
         return final_event or {}
+
+
+class OpenAIRealtimePool:
+    """Keep pre-connected realtime clients ready so calls skip the handshake.
+
+    Each client is handed out once and closed by its caller when the call
+    ends; realtime sessions keep conversation state, so they are never
+    returned for reuse. The pool reconnects a replacement in the background
+    and retires spares that have been idle longer than ``max_idle``.
+    """
+
+    def __init__(self, config: OpenAIConfig, max_idle: float = POOL_MAX_IDLE_SECONDS):
+        self._config = config
+        self._size = config.pool_size
+        self._max_idle = max_idle
+        # (connected_at, client) pairs; connected_at uses the loop clock
+        self._idle: asyncio.Queue[Tuple[float, OpenAIRealtimeClient]] = asyncio.Queue()
+        self._refills: Set[asyncio.Task] = set()
+        self._closing: Set[asyncio.Task] = set()
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._top_up()
+        if self._size > 0 and self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_periodically())
+
+    async def acquire(self) -> OpenAIRealtimeClient:
+        """Return a connected client, falling back to a fresh connection."""
+        try:
+            while True:
+                connected_at, client = self._idle.get_nowait()
+                if client.is_connected and not self._is_stale(connected_at):
+                    return client
+                # closing waits on a flush and a close handshake; keep that off the call
+                self._retire(client)
+        except asyncio.QueueEmpty:
+            client = OpenAIRealtimeClient(self._config)
+            await client.connect()
+            return client
+        finally:
+            self._top_up()
+
+    async def close(self) -> None:
+        self._size = 0
+        refresher, self._refresher = self._refresher, None
+        tasks = set(self._refills)
+        if refresher is not None:
+            tasks.add(refresher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while not self._idle.empty():
+            _, client = self._idle.get_nowait()
+            self._retire(client)
+        await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def _is_stale(self, connected_at: float, margin: float = 0.0) -> bool:
+        age = asyncio.get_running_loop().time() - connected_at
+        return age > self._max_idle - margin
+
+    def _retire(self, client: OpenAIRealtimeClient) -> None:
+        task = asyncio.create_task(client.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(POOL_REFRESH_INTERVAL)
+            self._evict_aging()
+            self._top_up()
+
+    def _evict_aging(self) -> None:
+        # retire spares that would go stale before the next refresh, so
+        # acquire() should rarely find one past max_idle
+        spares = []
+        while not self._idle.empty():
+            spares.append(self._idle.get_nowait())
+        for connected_at, client in spares:
+            if client.is_connected and not self._is_stale(connected_at, POOL_REFRESH_INTERVAL):
+                self._idle.put_nowait((connected_at, client))
+            else:
+                self._retire(client)
+
+    def _top_up(self) -> None:
+        missing = self._size - self._idle.qsize() - len(self._refills)
+        for _ in range(missing):
+            task = asyncio.create_task(self._connect_spare())
+            self._refills.add(task)
+            task.add_done_callback(self._refills.discard)
+
+    async def _connect_spare(self) -> None:
+        client = OpenAIRealtimeClient(self._config)
+        try:
+            await client.connect()
+        except Exception:
+            LOGGER.warning("Failed to pre-connect OpenAI realtime client", exc_info=True)
+            return
+        self._idle.put_nowait((asyncio.get_running_loop().time(), client))
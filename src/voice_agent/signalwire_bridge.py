@@ -2,152 +2,212 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import binascii
 import logging
-from typing import Dict, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional
 
-import websockets
+import msgspec
 from fastapi import WebSocket
 from starlette.websockets import WebSocketDisconnect
 
-from .config import settings
-from .openai_client import OpenAIRealtimeClient
+from .openai_client import OpenAIRealtimeClient, OpenAIRealtimePool
 
 LOGGER = logging.getLogger(__name__)
 
 
+class SignalWireMedia(msgspec.Struct):
+    payload: Optional[str] = None
+
+
+class SignalWireEvent(msgspec.Struct):
+    """Fields of a SignalWire stream event that the bridge inspects."""
+
+    event: Optional[str] = None
+    type: Optional[str] = None
+    streamId: Optional[str] = None
+    stream_id: Optional[str] = None
+    media: Optional[SignalWireMedia] = None
+
+
+_EVENT_DECODER = msgspec.json.Decoder(SignalWireEvent)
+
+# SignalWire media frames are matched by substring so the payload can be sliced
+# out without building a dict; anything unexpected falls back to a full parse.
+_MEDIA_EVENT_MARKER = '"event":"media"'
+_PAYLOAD_KEY = '"payload":"'
+_MEDIA_SUFFIX = '"}}'
+
+
 class SignalWireRealtimeBridge:
     """Handle a SignalWire websocket session and mirror audio to OpenAI."""
 
-    def __init__(self, websocket: WebSocket):
+    def __init__(self, websocket: WebSocket, openai_pool: OpenAIRealtimePool):
         self.websocket = websocket
-        self._openai_client = OpenAIRealtimeClient(settings.openai)
+        self._openai_pool = openai_pool
+        self._openai_client: Optional[OpenAIRealtimeClient] = None
         self._stream_id: Optional[str] = None
-        self._ready = asyncio.Event()
+        self._media_prefix = ""
+        # checked once per call so per-frame debug logging costs a single branch
+        self._debug = LOGGER.isEnabledFor(logging.DEBUG)
+        self._pending_audio: Deque[str] = deque()
+        self._out_queue: asyncio.Queue[str] = asyncio.Queue()
 
     async def run(self) -> None:
         await self.websocket.accept()
+        self._openai_client = await self._openai_pool.acquire()
         async with self._openai_client:
             receiver = asyncio.create_task(self._receive_from_signalwire())
             forwarder = asyncio.create_task(self._forward_openai_responses())
-            done, pending = await asyncio.wait(
-                {receiver, forwarder},
-                return_when=asyncio.FIRST_COMPLETED,
+            writer = asyncio.create_task(self._write_to_signalwire())
+            tasks = (receiver, forwarder, writer)
+            finished: asyncio.Future[asyncio.Task] = (
+                asyncio.get_running_loop().create_future()
             )
-            for task in pending:
-                task.cancel()
-            for task in done:
-                if task.exception():
-                    raise task.exception()
+
+            def _on_task_done(task: asyncio.Task) -> None:
+                if not finished.done():
+                    finished.set_result(task)
+
+            for task in tasks:
+                task.add_done_callback(_on_task_done)
+            try:
+                first = await finished
+            finally:
+                for task in tasks:
+                    task.cancel()
+            if not first.cancelled() and first.exception():
+                raise first.exception()
 
     async def _receive_from_signalwire(self) -> None:
+        receive_text = self.websocket.receive_text
+        queue_audio_chunk = self._openai_client.queue_audio_chunk
+        send_audio_chunk = self._openai_client.send_audio_chunk
+        debug = self._debug
         while True:
             try:
-                message = await self.websocket.receive_text()
+                message = await receive_text()
             except WebSocketDisconnect:
                 LOGGER.info("SignalWire websocket disconnected")
                 break
-            payload = json.loads(message)
-            event_type = payload.get("event") or payload.get("type")
-            LOGGER.debug("SignalWire event: %s", event_type)
+            if _MEDIA_EVENT_MARKER in message:
+                audio_payload = _extract_json_string(message, _PAYLOAD_KEY)
+                if audio_payload is not None:
+                    if debug:
+                        LOGGER.debug("SignalWire event: media")
+                    # media is the hot path: queue the append inline and only
+                    # await the client when the queue pushes back
+                    if audio_payload and not queue_audio_chunk(audio_payload):
+                        await send_audio_chunk(audio_payload)
+                    continue
+            payload = _EVENT_DECODER.decode(message)
+            event_type = payload.event or payload.type
+            if debug:
+                LOGGER.debug("SignalWire event: %s", event_type)
 
             if event_type == "start":
-                self._stream_id = payload.get("streamId") or payload.get("stream_id")
                 await self._on_start(payload)
             elif event_type == "media":
                 await self._on_media(payload)
             elif event_type in {"mark", "connected"}:
                 continue
             elif event_type in {"stop", "close"}:
-                await self._openai_client.send_json({"type": "input_audio_buffer.commit"})
-                await self._openai_client.send_json({"type": "response.create", "response": {}})
+                await self._openai_client.commit_input()
                 break
 
-    async def _on_start(self, payload: Dict) -> None:
-        stream_id = payload.get("streamId") or payload.get("stream_id")
+    async def _on_start(self, payload: SignalWireEvent) -> None:
+        stream_id = payload.streamId or payload.stream_id
         if not stream_id:
             LOGGER.warning("Missing stream id in start event: %s", payload)
             return
-        self._stream_id = stream_id
         await self._send_signalwire({"event": "ready"})
-        self._ready.set()
+        # outbound media frames only differ by payload, so pre-render the rest
+        self._media_prefix = (
+            '{"event":"media","streamId":'
+            + msgspec.json.encode(stream_id).decode()
+            + ',"media":{"payload":"'
+        )
+        self._stream_id = stream_id
         LOGGER.info("SignalWire stream ready: %s", stream_id)
+        if self._pending_audio:
+            pending = list(self._pending_audio)
+            self._pending_audio.clear()
+            await self._send_audio_to_signalwire(_merge_audio_payloads(pending))
 
-    async def _on_media(self, payload: Dict) -> None:
-        if "media" not in payload:
+    async def _on_media(self, payload: SignalWireEvent) -> None:
+        if payload.media is None:
             return
-        audio_payload = payload["media"].get("payload")
+        audio_payload = payload.media.payload
         if not audio_payload:
             return
         await self._openai_client.send_audio_chunk(audio_payload)
 
     async def _forward_openai_responses(self) -> None:
-        await self._ready.wait()
-        async for event in self._openai_client.responses():
-            event_type = event.get("type")
-            if event_type == "response.output_audio.delta":
-                delta = event.get("delta", {})
-                audio_chunk = delta.get("audio")
-                if audio_chunk:
-                    await self._send_audio_to_signalwire(audio_chunk)
-            elif event_type == "response.completed":
-                LOGGER.debug("OpenAI response completed")
-            elif event_type == "error":
-                LOGGER.error("OpenAI error: %s", event)
+        async for batch in self._openai_client.response_batches():
+            for event in batch:
+                event_type = event.type
+                if event_type == "response.output_audio.delta":
+                    delta = event.delta
+                    audio_chunk = delta.get("audio") if isinstance(delta, dict) else None
+                    if audio_chunk:
+                        self._out_queue.put_nowait(audio_chunk)
+                elif event_type == "response.completed":
+                    LOGGER.debug("OpenAI response completed")
+                elif event_type == "error":
+                    LOGGER.error("OpenAI error: %s", event)
+
+    async def _write_to_signalwire(self) -> None:
+        """Drain queued audio deltas and send each batch as one media frame."""
+        while True:
+            batch = [await self._out_queue.get()]
+            while True:
+                try:
+                    batch.append(self._out_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if self._stream_id is None:
+                # hold early audio until the start event assigns a stream id
+                self._pending_audio.extend(batch)
+                continue
+            await self._send_audio_to_signalwire(_merge_audio_payloads(batch))
 
     async def _send_audio_to_signalwire(self, audio_base64: str) -> None:
         if not self._stream_id:
             LOGGER.debug("Ignoring audio before stream id assignment")
             return
-        response = {
-            "event": "media",
-            "streamId": self._stream_id,
-            "media": {
-                "payload": audio_base64,
-            },
-        }
-        await self._send_signalwire(response)
+        if self._debug:
+            LOGGER.debug("Sending to SignalWire: media")
+        await self.websocket.send_text(self._media_prefix + audio_base64 + _MEDIA_SUFFIX)
 
     async def _send_signalwire(self, payload: Dict) -> None:
-        LOGGER.debug("Sending to SignalWire: %s", payload.get("event"))
-        await self.websocket.send_text(json.dumps(payload))
-
-
-async def connect_to_signalwire_room(room_name: str) -> None:
-    """Example helper showing how to create an outbound call via SignalWire."""
-
-    relay_url = f"wss://{settings.signalwire.space_url}/relay"
-    headers = {
-        "Authorization": settings.signalwire.api_token,
-        "SW-Project": settings.signalwire.project_id,
-    }
-
-    async with websockets.connect(relay_url, extra_headers=headers) as socket:
-        await socket.send(
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "signalwire.connect",
-                    "params": {"project": settings.signalwire.project_id},
-                }
-            )
-        )
-        await socket.recv()
-
-        await socket.send(
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "video.room.connect",
-                    "params": {
-                        "room": room_name,
-                    },
-                }
-            )
-        )
-        LOGGER.info("Joined SignalWire room %s", room_name)
-        while True:
-            message = await socket.recv()
-            LOGGER.debug("Relay message: %s", message)
+        if self._debug:
+            LOGGER.debug("Sending to SignalWire: %s", payload.get("event"))
+        await self.websocket.send_text(msgspec.json.encode(payload).decode())
+
+
+def _extract_json_string(message: str, key: str) -> Optional[str]:
+    """Return the raw string value following ``key`` without parsing JSON.
+
+    Returns ``None`` when the key is missing or the value contains escape
+    sequences, in which case the caller should parse the message fully.
+    """
+    start = message.find(key)
+    if start == -1:
+        return None
+    start += len(key)
+    end = message.find('"', start)
+    if end == -1:
+        return None
+    value = message[start:end]
+    if "\\" in value:
+        return None
+    return value
+
+
+def _merge_audio_payloads(payloads: List[str]) -> str:
+    """Combine base64 audio chunks into a single base64 payload."""
+    if len(payloads) == 1:
+        return payloads[0]
+    # base64 strings cannot be concatenated safely once padding is involved
+    audio = b"".join(binascii.a2b_base64(payload) for payload in payloads)
+    return binascii.b2a_base64(audio, newline=False).decode("ascii")
@@ -0,0 +1,51 @@
+"""Outbound SignalWire Relay helpers, kept apart from the call bridge."""
+from __future__ import annotations
+
+import logging
+
+import msgspec
+import websockets
+
+from .config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def connect_to_signalwire_room(room_name: str) -> None:
+    """Example helper showing how to create an outbound call via SignalWire."""
+
+    relay_url = f"wss://{settings.signalwire.space_url}/relay"
+    headers = {
+        "Authorization": settings.signalwire.api_token,
+        "SW-Project": settings.signalwire.project_id,
+    }
+
+    async with websockets.connect(relay_url, extra_headers=headers) as socket:
+        await socket.send(
+            msgspec.json.encode(
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "signalwire.connect",
+                    "params": {"project": settings.signalwire.project_id},
+                }
+            ).decode()
+        )
+        await socket.recv()
+
+        await socket.send(
+            msgspec.json.encode(
+                {
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "method": "video.room.connect",
+                    "params": {
+                        "room": room_name,
+                    },
+                }
+            ).decode()
+        )
+        LOGGER.info("Joined SignalWire room %s", room_name)
+        while True:
+            message = await socket.recv()
+            LOGGER.debug("Relay message: %s", message)